@@ -0,0 +1,161 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from litellm import acompletion, completion, ModelResponse
+from pydantic import create_model
+
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    # orjson is an optional speedup - stdlib json is the baseline
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+# On-disk cache for deterministic LLM calls, keyed by SHA-256 of the request.
+# Responses are only cached when temperature == 0 and every offered tool is
+# side-effect free, so replays are byte-identical by construction.
+CACHE_DIR = Path(".llm_cache")
+CACHE_TTL_SECONDS = 3600
+
+# Tools that are safe to serve from cache (read-only, no external writes)
+SAFE_TOOLS = {"current_date", "get_weather"}
+
+
+def cache_key(model, messages, tools, temperature) -> str:
+    """
+    Build a deterministic SHA-256 key from the request parameters.
+
+    Tool schemas are reduced to their sorted names - schema bodies are static
+    per tool name, so names are enough to discriminate requests.
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "tools": sorted(t["function"]["name"] for t in tools or []),
+        "temperature": temperature,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode()
+    ).hexdigest()
+
+
+# JSON schema "type" to Python annotation, for building argument validators
+_JSON_TYPE_MAP = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def build_arg_validators(tools) -> dict:
+    """
+    Build one pydantic model per tool from its JSON schema.
+
+    The tool schemas are fixed at startup, so the validators are constructed
+    once and reused for every call instead of re-interpreting the schema per
+    round trip. Validating arguments before dispatch also keeps malformed
+    LLM output from crashing the tool itself.
+
+    Args:
+        tools: Tool definitions in the OpenAI function-calling format
+
+    Returns:
+        Dict mapping tool name to its pydantic argument model
+    """
+    validators = {}
+    for tool in tools:
+        function = tool["function"]
+        schema = function.get("parameters", {})
+        required = set(schema.get("required", []))
+
+        fields = {}
+        for name, prop in schema.get("properties", {}).items():
+            annotation = _JSON_TYPE_MAP.get(prop.get("type"), str)
+            fields[name] = (annotation, ... if name in required else None)
+
+        validators[function["name"]] = create_model(
+            f"{function['name']}_args", **fields
+        )
+    return validators
+
+
+def _is_cacheable(temperature, tools) -> bool:
+    if temperature != 0:
+        return False
+    return all(t["function"]["name"] in SAFE_TOOLS for t in tools or [])
+
+
+def _cache_get(key: str):
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_set(key: str, response: ModelResponse) -> None:
+    CACHE_DIR.mkdir(exist_ok=True)
+    (CACHE_DIR / f"{key}.json").write_text(json.dumps(response.model_dump()))
+
+
+def cached_completion(**kwargs) -> ModelResponse:
+    """
+    Drop-in replacement for litellm.completion with response caching.
+    """
+    if not _is_cacheable(kwargs.get("temperature"), kwargs.get("tools")):
+        return completion(**kwargs)
+
+    key = cache_key(
+        kwargs.get("model"),
+        kwargs.get("messages"),
+        kwargs.get("tools"),
+        kwargs.get("temperature"),
+    )
+    cached = _cache_get(key)
+    if cached is not None:
+        return ModelResponse.model_validate(cached)
+
+    response = completion(**kwargs)
+    if isinstance(response, ModelResponse):
+        _cache_set(key, response)
+    return response
+
+
+async def cached_acompletion(**kwargs) -> ModelResponse:
+    """
+    Drop-in replacement for litellm.acompletion with response caching.
+    """
+    if not _is_cacheable(kwargs.get("temperature"), kwargs.get("tools")):
+        return await acompletion(**kwargs)
+
+    key = cache_key(
+        kwargs.get("model"),
+        kwargs.get("messages"),
+        kwargs.get("tools"),
+        kwargs.get("temperature"),
+    )
+    cached = _cache_get(key)
+    if cached is not None:
+        return ModelResponse.model_validate(cached)
+
+    response = await acompletion(**kwargs)
+    if isinstance(response, ModelResponse):
+        _cache_set(key, response)
+    return response
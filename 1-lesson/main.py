@@ -1,8 +1,10 @@
-import litellm
-from litellm import ModelResponse, Choices, Message
+import asyncio
+from litellm import ModelResponse, Choices
 from devtools import debug
 from datetime import date
-import json
+from pydantic import ValidationError
+
+from llm_cache import build_arg_validators, cached_acompletion, json_dumps, json_loads
 
 tools = [
     {
@@ -43,7 +45,11 @@ available_tools = {
     "get_weather": get_weather
 }
 
-messages = [
+# Per-tool pydantic argument models, built once from the fixed schemas
+arg_validators = build_arg_validators(tools)
+
+async def main():
+    messages = [
         {
             "role": "system",
             "content": "You are a helpful assistant."
@@ -54,53 +60,86 @@ messages = [
         }
     ]
 
-response = litellm.completion(
-    model="ollama/mistral-small3.2",
-    messages=messages,
-    tools=tools,
-    tool_choice="auto",
-    api_base="http://host.docker.internal:11434"
-)
-
-if isinstance(response, ModelResponse) and len(response.choices) > 0:
-    choice = response.choices[0]
-    if isinstance(choice, Choices):
-        response_message = choice.message
-
-        if response_message.tool_calls and len(response_message.tool_calls) > 0:
-            tool_call = response_message.tool_calls[0]
-            messages.append({
-                "role": "assistant",
-                "content": response_message.content or "",
-                "tool_calls": [
-                    {
-                        "id": tool_call.id,
-                        "type": "function",
-                        "function": {
-                            "name": tool_call.function.name,
-                            "arguments": tool_call.function.arguments,
-                        }
-                    }
-                ]
-            })
+    # temperature=0 makes the call deterministic, which is what lets the
+    # response cache serve repeated runs of this demo
+    response = await cached_acompletion(
+        model="ollama/mistral-small3.2",
+        messages=messages,
+        tools=tools,
+        tool_choice="auto",
+        temperature=0,
+        api_base="http://host.docker.internal:11434"
+    )
 
-            function_name = tool_call.function.name
-            function_arguments = json.loads(tool_call.function.arguments)
-            tool_id = tool_call.id
-            if function_name in available_tools:
-                tool_response = available_tools[function_name](**function_arguments)
+    if isinstance(response, ModelResponse) and len(response.choices) > 0:
+        choice = response.choices[0]
+        if isinstance(choice, Choices):
+            response_message = choice.message
 
+            if response_message.tool_calls and len(response_message.tool_calls) > 0:
+                # Echo the full assistant turn back so every tool result can
+                # be matched to its tool_call_id in the follow-up request
                 messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "name": function_name,
-                    "content": json.dumps(tool_response)
+                    "role": "assistant",
+                    "content": response_message.content or "",
+                    "tool_calls": [
+                        {
+                            "id": tool_call.id,
+                            "type": "function",
+                            "function": {
+                                "name": tool_call.function.name,
+                                "arguments": tool_call.function.arguments,
+                            }
+                        }
+                        for tool_call in response_message.tool_calls
+                    ]
                 })
 
-                final_response = litellm.completion(
+                async def run_one(tool_call):
+                    # Validate arguments against the tool's schema so
+                    # malformed LLM output fails cleanly before dispatch -
+                    # the failure becomes an error tool result the model
+                    # can react to instead of an exception that would kill
+                    # the whole gather
+                    try:
+                        raw_arguments = json_loads(tool_call.function.arguments)
+                        validated = arg_validators[tool_call.function.name](**raw_arguments)
+                    except (ValidationError, ValueError) as error:
+                        return tool_call, {"error": f"Invalid arguments: {error}"}
+                    function_arguments = validated.model_dump(exclude_unset=True)
+
+                    function = available_tools[tool_call.function.name]
+                    if asyncio.iscoroutinefunction(function):
+                        tool_response = await function(**function_arguments)
+                    else:
+                        tool_response = await asyncio.to_thread(function, **function_arguments)
+                    return tool_call, tool_response
+
+                # Independent tool calls overlap, so the tool phase costs
+                # max(tool_i) instead of sum(tool_i)
+                results = await asyncio.gather(*[
+                    run_one(tool_call)
+                    for tool_call in response_message.tool_calls
+                    if tool_call.function.name in available_tools
+                ])
+
+                for tool_call, tool_response in results:
+                    messages.append({
+                        "role": "tool",
+                        "tool_call_id": tool_call.id,
+                        "name": tool_call.function.name,
+                        "content": json_dumps(tool_response)
+                    })
+
+                final_response = await cached_acompletion(
                     model="ollama/mistral-small3.2",
                     messages=messages,
+                    temperature=0,
                     api_base="http://host.docker.internal:11434"
                 )
-                
-                debug(final_response)
\ No newline at end of file
+
+                debug(final_response)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -25,7 +25,8 @@ class GridWorldEnv(gym.Env):
         render_mode: Optional[str] = None,
         step_reward: float = -0.01,
         obstacle_reward: float = -1.0,
-        goal_reward: float = 1.0
+        goal_reward: float = 1.0,
+        seed: Optional[int] = None
     ):
         """
         Initialize Grid World environment.
@@ -40,6 +41,8 @@ class GridWorldEnv(gym.Env):
             step_reward: Reward for each step
             obstacle_reward: Penalty for hitting obstacle or wall
             goal_reward: Reward for reaching goal
+            seed: Optional seed for the gym RNG; makes random obstacle
+                placement (and thus the whole maze) reproducible
         """
         super().__init__()
 
@@ -56,6 +59,10 @@ class GridWorldEnv(gym.Env):
         self.start_pos = start_pos if start_pos is not None else (0, 0)
         self.goal_pos = goal_pos if goal_pos is not None else (grid_size - 1, grid_size - 1)
 
+        # Seed the gym RNG before obstacles are drawn - seeding only at
+        # reset() would come too late to make the maze itself reproducible
+        super().reset(seed=seed)
+
         # Initialize grid with obstacles
         self.grid = np.zeros((grid_size, grid_size), dtype=int)
 
@@ -70,6 +77,8 @@ class GridWorldEnv(gym.Env):
             self._generate_random_obstacles(n_obstacles)
 
         # Action space: 0=UP, 1=DOWN, 2=LEFT, 3=RIGHT
+        # Precomputed (d_row, d_col) per action replaces if/elif dispatch
+        self._DELTAS = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)], dtype=np.int8)
         self.action_space = spaces.Discrete(4)
 
         # Observation space: flatten grid position to single integer
@@ -79,28 +88,84 @@ class GridWorldEnv(gym.Env):
         # Current agent position
         self.agent_pos = self.start_pos
 
+        # Precompute dense transition tables so step() is a table lookup
+        # instead of a branch ladder
+        self._build_transition_tables()
+
+        # Static character grid for rendering - only the agent cell changes
+        # between frames
+        self._char_grid = np.full((grid_size, grid_size), ".", dtype="<U1")
+        self._char_grid[self.grid == 1] = "#"
+        self._char_grid[self.goal_pos] = "G"
+
+    def _build_transition_tables(self) -> None:
+        """
+        Precompute next state, reward and terminal flag for every
+        (state, action) pair.
+
+        With the tables in place, step() reduces to three array loads and
+        one assignment - branchless and cache-friendly - and the same
+        tables can be fed directly to the compiled training kernel.
+        """
+        n_states = self.grid_size * self.grid_size
+
+        self.next_state_table = np.empty((n_states, 4), dtype=np.int32)
+        self.reward_table = np.empty((n_states, 4), dtype=np.float32)
+        self.terminal_table = np.zeros((n_states, 4), dtype=bool)
+
+        for row in range(self.grid_size):
+            for col in range(self.grid_size):
+                state = row * self.grid_size + col
+
+                for action in range(4):
+                    d_row, d_col = self._DELTAS[action]
+                    new_row = row + int(d_row)
+                    new_col = col + int(d_col)
+
+                    if (
+                        new_row < 0
+                        or new_row >= self.grid_size
+                        or new_col < 0
+                        or new_col >= self.grid_size
+                        or self.grid[new_row, new_col] == 1
+                    ):
+                        # Wall or obstacle - stay in place, get penalty
+                        self.next_state_table[state, action] = state
+                        self.reward_table[state, action] = self.obstacle_reward
+                    elif (new_row, new_col) == self.goal_pos:
+                        self.next_state_table[state, action] = (
+                            new_row * self.grid_size + new_col
+                        )
+                        self.reward_table[state, action] = self.goal_reward
+                        self.terminal_table[state, action] = True
+                    else:
+                        self.next_state_table[state, action] = (
+                            new_row * self.grid_size + new_col
+                        )
+                        self.reward_table[state, action] = self.step_reward
+
     def _generate_random_obstacles(self, n_obstacles: int) -> None:
         """
         Generate random obstacles in the grid, avoiding start and goal positions.
 
+        Obstacles are drawn in one vectorized sample over the free cells
+        instead of Python-level rejection sampling, and use the gym-managed
+        np_random generator so placement is reproducible under seeding.
+
         Args:
             n_obstacles: Number of obstacles to generate
         """
-        placed = 0
-        max_attempts = n_obstacles * 10  # Prevent infinite loop
-        attempts = 0
-
-        while placed < n_obstacles and attempts < max_attempts:
-            row = np.random.randint(0, self.grid_size)
-            col = np.random.randint(0, self.grid_size)
-            pos = (row, col)
-
-            # Don't place obstacle on start or goal
-            if pos != self.start_pos and pos != self.goal_pos and self.grid[row, col] == 0:
-                self.grid[row, col] = 1
-                placed += 1
-
-            attempts += 1
+        flat_start = self.start_pos[0] * self.grid_size + self.start_pos[1]
+        flat_goal = self.goal_pos[0] * self.grid_size + self.goal_pos[1]
+
+        # All cells except start and goal are candidates
+        free = np.setdiff1d(
+            np.arange(self.grid_size * self.grid_size), [flat_start, flat_goal]
+        )
+        chosen = self.np_random.choice(
+            free, size=min(n_obstacles, free.size), replace=False
+        )
+        self.grid.flat[chosen] = 1
 
     def _get_state(self) -> int:
         """
@@ -153,75 +218,51 @@ class GridWorldEnv(gym.Env):
         Returns:
             Tuple of (next_state, reward, terminated, truncated, info)
         """
-        # Calculate new position based on action
-        row, col = self.agent_pos
-
-        if action == 0:  # UP
-            new_pos = (row - 1, col)
-        elif action == 1:  # DOWN
-            new_pos = (row + 1, col)
-        elif action == 2:  # LEFT
-            new_pos = (row, col - 1)
-        elif action == 3:  # RIGHT
-            new_pos = (row, col + 1)
-        else:
+        if not 0 <= action < 4:
             raise ValueError(f"Invalid action: {action}")
 
-        # Check if new position is valid
-        new_row, new_col = new_pos
-
-        # Check boundaries
-        if new_row < 0 or new_row >= self.grid_size or new_col < 0 or new_col >= self.grid_size:
-            # Hit wall - stay in place, get penalty
-            reward = self.obstacle_reward
-            terminated = False
-        # Check obstacle
-        elif self.grid[new_row, new_col] == 1:
-            # Hit obstacle - stay in place, get penalty
-            reward = self.obstacle_reward
-            terminated = False
-        else:
-            # Valid move
-            self.agent_pos = new_pos
-            reward = self.step_reward
-
-            # Check if reached goal
-            if self.agent_pos == self.goal_pos:
-                reward = self.goal_reward
-                terminated = True
-            else:
-                terminated = False
-
-        truncated = False
-        info = {}
-
-        return self._get_state(), reward, terminated, truncated, info
+        # Look up the precomputed transition - no branching in the hot path
+        state = self._get_state()
+        next_state = int(self.next_state_table[state, action])
+        self.agent_pos = (next_state // self.grid_size, next_state % self.grid_size)
+
+        return (
+            next_state,
+            float(self.reward_table[state, action]),
+            bool(self.terminal_table[state, action]),
+            False,
+            {},
+        )
+
+    def _build_frame(self) -> str:
+        """
+        Build the grid frame (clear-screen sequence, borders and cells)
+        as one string.
+
+        Only the agent cell changes between frames, so the static character
+        grid is copied and the agent overlaid, then everything is joined
+        into a single string - one stdout write per frame instead of one
+        per cell.
+
+        Returns:
+            Frame as a single printable string
+        """
+        chars = self._char_grid.copy()
+        chars[self.agent_pos] = "A"
+
+        border = "=" * (self.grid_size * 2 + 1)
+        body = "\n".join("|" + " ".join(row) + " |" for row in chars)
+        return f"\033[2J\033[H{border}\n{body}\n{border}"
 
     def render(self):
         """
         Render the environment in human-readable format (ASCII).
         """
         if self.render_mode == "human":
-            # Clear screen (works in most terminals)
-            print("\033[2J\033[H", end="")
-
-            print("=" * (self.grid_size * 2 + 1))
-            for row in range(self.grid_size):
-                print("|", end="")
-                for col in range(self.grid_size):
-                    pos = (row, col)
-                    if pos == self.agent_pos:
-                        print("A", end=" ")  # Agent
-                    elif pos == self.goal_pos:
-                        print("G", end=" ")  # Goal
-                    elif self.grid[row, col] == 1:
-                        print("#", end=" ")  # Obstacle
-                    else:
-                        print(".", end=" ")  # Empty
-                print("|")
-            print("=" * (self.grid_size * 2 + 1))
-            print(f"Position: {self.agent_pos} | Goal: {self.goal_pos}")
-            print()
+            print(
+                f"{self._build_frame()}\n"
+                f"Position: {self.agent_pos} | Goal: {self.goal_pos}\n"
+            )
 
     def render_episode_step(self, action: Optional[int] = None, reward: float = 0, delay: float = 0.3):
         """
@@ -234,29 +275,11 @@ class GridWorldEnv(gym.Env):
         """
         action_names = ["UP ↑", "DOWN ↓", "LEFT ←", "RIGHT →"]
 
-        # Clear screen
-        print("\033[2J\033[H", end="")
-
-        print("=" * (self.grid_size * 2 + 1))
-        for row in range(self.grid_size):
-            print("|", end="")
-            for col in range(self.grid_size):
-                pos = (row, col)
-                if pos == self.agent_pos:
-                    print("A", end=" ")  # Agent
-                elif pos == self.goal_pos:
-                    print("G", end=" ")  # Goal
-                elif self.grid[row, col] == 1:
-                    print("#", end=" ")  # Obstacle
-                else:
-                    print(".", end=" ")  # Empty
-            print("|")
-        print("=" * (self.grid_size * 2 + 1))
-
+        frame = self._build_frame()
         if action is not None:
-            print(f"Action: {action_names[action]} | Reward: {reward:.2f}")
-        print(f"Position: {self.agent_pos} | Goal: {self.goal_pos}")
-        print()
+            frame += f"\nAction: {action_names[action]} | Reward: {reward:.2f}"
+        frame += f"\nPosition: {self.agent_pos} | Goal: {self.goal_pos}\n"
+        print(frame)
 
         time.sleep(delay)
 
@@ -1,7 +1,12 @@
-import numpy as np
+import multiprocessing
+import os
 import random
+from typing import List, Optional
+
+import numpy as np
 from q_learning import QLearningAgent
 from grid_env import GridWorldEnv
+from qlearn_numba import run_episode, seed_rng, NUMBA_AVAILABLE
 from utils import print_policy, visualize_episode
 
 
@@ -16,6 +21,8 @@ def train_agent(
     epsilon_min: float = 0.01,
     save_q_table: bool = True,
     q_table_filename: str = None,
+    use_numba: bool = NUMBA_AVAILABLE,
+    seed: Optional[int] = None,
 ) -> QLearningAgent:
     """
     Train Q-learning agent in the specified environment.
@@ -31,6 +38,9 @@ def train_agent(
         epsilon_min: Minimum epsilon value
         save_q_table: Whether to save Q-table after training
         q_table_filename: Custom filename for Q-table (default: auto-generated)
+        use_numba: Whether to run episodes through the compiled kernel
+            (falls back to the Python loop when numba is not installed)
+        seed: Optional seed for the agent's exploration randomness
 
     Returns:
         Trained QLearningAgent
@@ -45,11 +55,21 @@ def train_agent(
         epsilon=epsilon,
         epsilon_decay=epsilon_decay,
         epsilon_min=epsilon_min,
+        seed=seed,
     )
 
-    # Training metrics
-    episode_rewards = []
-    episode_lengths = []
+    # Training metrics - preallocated so per-episode bookkeeping is an
+    # index assignment and window stats are plain array slices
+    episode_rewards = np.empty(n_episodes, dtype=np.float32)
+    episode_lengths = np.empty(n_episodes, dtype=np.int32)
+
+    # Transition buffer - transitions are accumulated and flushed to the
+    # agent in batches so the Bellman update runs vectorized in NumPy
+    flush_every = 64
+    buffer = np.empty(
+        flush_every,
+        dtype=[("s", "i4"), ("a", "i1"), ("r", "f4"), ("ns", "i4"), ("d", "?")],
+    )
 
     print(f"Starting training for {n_episodes} episodes...")
     print(f"Grid size: {env.grid_size}x{env.grid_size}")
@@ -62,40 +82,95 @@ def train_agent(
     )
     print("=" * 70)
 
-    for episode in range(n_episodes):
-        state, _ = env.reset()
-        total_reward = 0
-        steps = 0
-
-        for step in range(max_steps):
-            # Select and perform action
-            action = agent.select_action(state, training=True)
-            next_state, reward, terminated, truncated, _ = env.step(action)
-            done = terminated or truncated
-
-            # Update Q-table
-            agent.update(state, action, reward, next_state, done)
+    start_row, start_col = env.start_pos
+    start_state = start_row * env.grid_size + start_col
 
-            total_reward += reward
-            state = next_state
-            steps += 1
+    # Precompute the full epsilon schedule - per-episode decay becomes an
+    # array lookup instead of a method call and a max()
+    eps_schedule = np.maximum(
+        epsilon_min,
+        epsilon * np.power(epsilon_decay, np.arange(n_episodes), dtype=np.float64),
+    )
 
-            if done:
-                break
+    # The compiled kernel has its own RNG state, separate from the agent's
+    # generator - seed it per run so the numba path is as reproducible as
+    # the Python fallback
+    if use_numba and seed is not None:
+        seed_rng(seed)
 
-        # Decay epsilon after each episode
-        agent.decay_epsilon()
+    for episode in range(n_episodes):
+        agent.epsilon = float(eps_schedule[episode])
+
+        if use_numba:
+            # Run the whole episode in one compiled kernel call - the env's
+            # precomputed transition tables replace per-step env.step calls
+            total_reward, steps = run_episode(
+                agent.q_table,
+                env.next_state_table,
+                env.reward_table,
+                env.terminal_table,
+                start_state,
+                max_steps,
+                agent.learning_rate,
+                agent.discount_factor,
+                agent.epsilon,
+            )
+        else:
+            state, _ = env.reset()
+            total_reward = 0
+            steps = 0
+            buffered = 0
+
+            # Pre-draw the episode's randoms in bulk - one RNG call per
+            # episode instead of two per step
+            rand_floats = agent.rng.random(max_steps)
+            rand_actions = agent.rng.integers(0, agent.n_actions, max_steps)
+
+            for step in range(max_steps):
+                # Select and perform action
+                action = agent.select_action_fast(
+                    state, rand_floats[step], rand_actions[step]
+                )
+                next_state, reward, terminated, truncated, _ = env.step(action)
+                done = terminated or truncated
+
+                # Buffer the transition and flush in vectorized batches
+                buffer[buffered] = (state, action, reward, next_state, done)
+                buffered += 1
+                if buffered == flush_every:
+                    agent.update_batch(
+                        buffer["s"], buffer["a"], buffer["r"], buffer["ns"], buffer["d"]
+                    )
+                    buffered = 0
+
+                total_reward += reward
+                state = next_state
+                steps += 1
+
+                if done:
+                    break
+
+            # Flush remaining transitions at episode end
+            if buffered > 0:
+                agent.update_batch(
+                    buffer["s"][:buffered],
+                    buffer["a"][:buffered],
+                    buffer["r"][:buffered],
+                    buffer["ns"][:buffered],
+                    buffer["d"][:buffered],
+                )
 
         # Store metrics
-        episode_rewards.append(total_reward)
-        episode_lengths.append(steps)
+        episode_rewards[episode] = total_reward
+        episode_lengths[episode] = steps
 
         # Print progress every 500 episodes
         if (episode + 1) % 500 == 0:
-            window = min(500, len(episode_rewards))
-            avg_reward = np.mean(episode_rewards[-window:])
-            avg_length = np.mean(episode_lengths[-window:])
-            success_rate = sum(1 for r in episode_rewards[-window:] if r > 0) / window
+            window_start = max(0, episode - 499)
+            reward_window = episode_rewards[window_start:episode + 1]
+            avg_reward = reward_window.mean()
+            avg_length = episode_lengths[window_start:episode + 1].mean()
+            success_rate = (reward_window > 0).mean()
             print(
                 f"Episode {episode + 1}/{n_episodes} | "
                 f"Avg Reward: {avg_reward:.3f} | "
@@ -118,6 +193,61 @@ def train_agent(
     return agent
 
 
+def train_one(seed: int, config: Optional[dict] = None) -> np.ndarray:
+    """
+    Train a single agent in a freshly built environment and return its Q-table.
+
+    Builds the environment and agent inside the call so the function is a
+    self-contained, picklable unit of work for multiprocessing.
+
+    Args:
+        seed: Random seed for this training run
+        config: Optional dict with an "env" entry of GridWorldEnv kwargs;
+            remaining entries are passed through to train_agent
+
+    Returns:
+        Trained Q-table
+    """
+    config = dict(config or {})
+    env_kwargs = config.pop("env", {})
+
+    # Seed at construction so obstacle placement is part of the seeded
+    # run - every worker with the same config then trains on the same maze
+    env = GridWorldEnv(seed=seed, **env_kwargs)
+    env.reset(seed=seed)
+
+    agent = train_agent(env=env, save_q_table=False, seed=seed, **config)
+    return agent.q_table
+
+
+def train_parallel(
+    seeds: List[int],
+    config: Optional[dict] = None,
+    n_workers: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Train one agent per seed in parallel worker processes.
+
+    Training is embarrassingly parallel across seeds and the GIL rules out
+    threads for this CPU-bound loop, so each run gets its own process and
+    the resulting Q-tables are averaged into one table.
+
+    Args:
+        seeds: One random seed per training run
+        config: Configuration passed to train_one (see train_one)
+        n_workers: Number of worker processes (default: all CPU cores)
+
+    Returns:
+        Element-wise mean of the trained Q-tables
+    """
+    n_workers = n_workers or os.cpu_count()
+
+    with multiprocessing.Pool(n_workers) as pool:
+        q_tables = pool.starmap(train_one, [(seed, config) for seed in seeds])
+
+    return np.mean(q_tables, axis=0, dtype=np.float32)
+
+
 def evaluate_agent(
     agent: QLearningAgent,
     env: GridWorldEnv,
@@ -137,6 +267,10 @@ def evaluate_agent(
     successful_episodes = 0
     episode_lengths = []
 
+    # Greedy evaluation depends only on the Q-table, so the policy can be
+    # computed once up front instead of running argmax on every step
+    policy = np.ascontiguousarray(agent.q_table.argmax(axis=1).astype(np.int8))
+
     print(f"\nEvaluating agent for {n_episodes} episodes...")
     print("=" * 70)
 
@@ -148,7 +282,7 @@ def evaluate_agent(
 
         while not done:
             # Use greedy policy (no exploration)
-            action = agent.select_action(state, training=False)
+            action = int(policy[state])
             next_state, reward, terminated, truncated, _ = env.step(action)
             done = terminated or truncated
 
@@ -178,6 +312,7 @@ def evaluate_agent(
         agent.q_table,
         env_shape=(env.grid_size, env.grid_size),
         action_symbols=action_symbols,
+        policy=policy,
     )
 
     # Visualize one episode with real-time animation
@@ -1,4 +1,5 @@
 import numpy as np
+from typing import Optional
 
 
 class QLearningAgent:
@@ -18,6 +19,7 @@ class QLearningAgent:
         epsilon: float = 1.0,
         epsilon_decay: float = 0.995,
         epsilon_min: float = 0.01,
+        seed: Optional[int] = None,
     ):
         """
         Initialize Q-learning agent.
@@ -30,6 +32,7 @@ class QLearningAgent:
             epsilon: Initial exploration rate for epsilon-greedy policy
             epsilon_decay: Rate at which epsilon decreases after each episode
             epsilon_min: Minimum value for epsilon
+            seed: Optional seed for the agent's random generator
         """
         self.n_states = n_states
         self.n_actions = n_actions
@@ -39,9 +42,15 @@ class QLearningAgent:
         self.epsilon_decay = epsilon_decay
         self.epsilon_min = epsilon_min
 
+        # PCG64 generator - faster than the legacy global Mersenne-Twister
+        # API and independently seedable per agent
+        self.rng = np.random.default_rng(seed)
+
         # Initialize Q-table with zeros
         # Q[state, action] represents expected cumulative reward
-        self.q_table = np.zeros((n_states, n_actions))
+        # float32 halves memory traffic in the hot loop and has ample
+        # precision for tabular rewards in [-1, 1]
+        self.q_table = np.zeros((n_states, n_actions), dtype=np.float32)
 
     def select_action(self, state: int, training: bool = True) -> int:
         """
@@ -57,13 +66,36 @@ class QLearningAgent:
         Returns:
             Selected action
         """
-        if training and np.random.random() < self.epsilon:
+        if training and self.rng.random() < self.epsilon:
             # Explore: random action
-            return np.random.randint(0, self.n_actions)
+            return int(self.rng.integers(0, self.n_actions))
         else:
             # Exploit: best action based on Q-values
             return np.argmax(self.q_table[state])
 
+    def select_action_fast(
+        self, state: int, rand_float: float, rand_action: int, training: bool = True
+    ) -> int:
+        """
+        Epsilon-greedy selection using pre-drawn random numbers.
+
+        Drawing the per-step randoms in bulk once per episode avoids one
+        Python-to-C RNG transition per step, which adds up over a full
+        training run.
+
+        Args:
+            state: Current state
+            rand_float: Pre-drawn uniform float in [0, 1) for the explore test
+            rand_action: Pre-drawn random action for the explore branch
+            training: Whether in training mode (uses epsilon-greedy) or evaluation mode (greedy)
+
+        Returns:
+            Selected action
+        """
+        if training and rand_float < self.epsilon:
+            return rand_action
+        return int(self.q_table[state].argmax())
+
     def update(
         self, state: int, action: int, reward: float, next_state: int, done: bool
     ) -> None:
@@ -79,6 +111,8 @@ class QLearningAgent:
         - γ is the discount factor
         - max(Q(s',a')) is the maximum Q-value for the next state s'
 
+        Thin wrapper around update_batch for single transitions.
+
         Args:
             state: Current state
             action: Action taken
@@ -86,20 +120,56 @@ class QLearningAgent:
             next_state: Next state after taking action
             done: Whether episode is finished
         """
-        # Current Q-value
-        current_q = self.q_table[state, action]
+        self.update_batch(
+            np.array([state]),
+            np.array([action]),
+            np.array([reward]),
+            np.array([next_state]),
+            np.array([done]),
+        )
+
+    def update_batch(
+        self,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_states: np.ndarray,
+        dones: np.ndarray,
+    ) -> None:
+        """
+        Apply the Q-learning update rule to a whole batch of transitions at once.
 
-        # Maximum Q-value for next state (0 if episode is done)
-        max_next_q = 0 if done else np.max(self.q_table[next_state])
+        Vectorizing the Bellman update over a minibatch moves the per-step
+        work from the Python interpreter into NumPy, which is much faster
+        for long training runs.
 
-        # Calculate new Q-value using Bellman equation
-        new_q = current_q + self.learning_rate * (
-            reward + self.discount_factor * max_next_q - current_q
+        Args:
+            states: Array of states
+            actions: Array of actions taken
+            rewards: Array of rewards received
+            next_states: Array of next states
+            dones: Boolean array marking terminal transitions
+        """
+        # Current Q-values for each (state, action) pair
+        current_q = self.q_table[states, actions]
+
+        # Maximum Q-value for each next state (0 for terminal transitions)
+        max_next_q = self.q_table[next_states].max(axis=1)
+        max_next_q[dones] = 0
+
+        # Bellman targets for the whole batch, kept in float32 so the
+        # update does not silently upcast the table arithmetic
+        rewards = np.asarray(rewards, dtype=np.float32)
+        targets = rewards + np.float32(self.discount_factor) * max_next_q
+
+        # np.add.at accumulates correctly when the same (state, action)
+        # pair appears more than once in the batch
+        np.add.at(
+            self.q_table,
+            (states, actions),
+            np.float32(self.learning_rate) * (targets - current_q),
         )
 
-        # Update Q-table
-        self.q_table[state, action] = new_q
-
     def decay_epsilon(self) -> None:
         """
         Decay epsilon after each episode to gradually reduce exploration.
@@ -135,5 +205,5 @@ class QLearningAgent:
         Args:
             filename: Path to the Q-table file (should end with .npy)
         """
-        self.q_table = np.load(filename)
+        self.q_table = np.load(filename).astype(np.float32, copy=False)
         print(f"Q-table loaded from '{filename}'")
@@ -1,9 +1,12 @@
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 def print_policy(
-    q_table: np.ndarray, env_shape: tuple, action_symbols: List[str]
+    q_table: np.ndarray,
+    env_shape: tuple,
+    action_symbols: List[str],
+    policy: Optional[np.ndarray] = None,
 ) -> None:
     """
     Print the learned policy as a grid showing the best action for each state.
@@ -12,11 +15,15 @@ def print_policy(
         q_table: Q-table with shape (n_states, n_actions)
         env_shape: Shape of the environment grid (rows, cols)
         action_symbols: List of symbols representing each action (e.g., ['←', '↓', '→', '↑'])
+        policy: Optional precomputed greedy policy (argmax per state) to
+            reuse instead of recomputing it from the Q-table
     """
     print("\nLearned Policy (best action for each state):")
     print("=" * 50)
 
-    best_actions = np.argmax(q_table, axis=1).reshape(env_shape)
+    if policy is None:
+        policy = np.argmax(q_table, axis=1)
+    best_actions = policy.reshape(env_shape)
 
     for i in range(env_shape[0]):
         row = ""
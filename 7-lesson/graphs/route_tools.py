@@ -1,5 +1,8 @@
+import logging
 from langchain_core.messages import AIMessage
-from .state import State, get_last_message
+from .state import State
+
+logger = logging.getLogger(__name__)
 
 
 class RouteTools:
@@ -20,22 +23,27 @@ class RouteTools:
         """
         Route decision based on tool calls in last message.
 
+        Runs on every graph transition, so the last message is bound to a
+        local and the debug dump is gated behind the logger level -
+        stringifying a message with large tool payloads on each hop is
+        expensive.
+
         Args:
             state: Current graph state
 
         Returns:
             Node name to route to
         """
-        # Get the last message from LLM
-        last_message = get_last_message(state)
-        print("----- Router -----")
-        print(last_message)
+        messages = state["messages"]
+        last_message = messages[-1] if messages else None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("----- Router -----")
+            logger.debug("%s", last_message)
 
         # Check if it's an AI message with tool calls
-        if isinstance(last_message, AIMessage):
-            tool_calls = getattr(last_message, "tool_calls", None) or []
-            if tool_calls:
-                return self.tools_node
+        if isinstance(last_message, AIMessage) and getattr(last_message, "tool_calls", None):
+            return self.tools_node
 
         # No tool calls - go to end
         return self.end_node
@@ -1,16 +1,20 @@
 import os
 import asyncio
+import logging
 from dotenv import load_dotenv
 from .nodes import ChatNode, MCPNode
 from .graphs import State, RouteTools
+from .tools import make_batch_execute_tool
 from langgraph.graph import StateGraph, START, END
 from langchain_core.messages import HumanMessage, SystemMessage
-from devtools import debug
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langchain_ollama import ChatOllama
 
 load_dotenv()
 
+# Log level is configurable so debug dumps stay off the hot path by default
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+
 # Vault path configuration
 vault_path = os.getenv("VAULT_PATH", "/app/7-lesson/vault")
 
@@ -34,6 +38,8 @@ You have access to filesystem tools that allow you to:
 
 IMPORTANT: Always use the available tools to search and read files in the vault before answering questions about its contents. Don't assume what files exist - use list_directory, search_files, and read_file tools to find the information.
 
+IMPORTANT: When you need multiple file operations (e.g. reading several files), call batch_execute once with all of them instead of calling tools one at a time.
+
 The vault is located at: {vault_path}
 When using tools, always use this path or paths within it. For example:
 - list_directory: use "{vault_path}"
@@ -44,6 +50,10 @@ IMPORTANT: After you have gathered the necessary information using tools, ALWAYS
 
 Always respond in Czech and strive to be as helpful as possible when working with the knowledge system."""
 
+# One shared SystemMessage instance - stable identity and content help
+# upstream prompt caching and avoid re-allocating the >1KB prompt per turn
+SYSTEM_MSG = SystemMessage(content=system_prompt)
+
 filesystem_config = {
     "filesystem": {
         "command": "mcp-server-filesystem",
@@ -51,79 +61,128 @@ filesystem_config = {
         "transport": "stdio",
     }
 }
-mcp_client = MultiServerMCPClient(filesystem_config)
-
-# Get tools async
-async def get_mcp_tools():
-    return await mcp_client.get_tools()
-
-# Run async function to get tools
-all_tools = asyncio.run(get_mcp_tools())
 
-# Initialize Ollama LLM
-llm = ChatOllama(
-    model=os.getenv("LLM_MODEL", "gemma3:27b"),
-    base_url=os.getenv("OLLAMA_API_BASE", "http://host.docker.internal:11434"),
-    temperature=0.7,
-)
 
-# Bind tools to LLM
-llm_with_tools = llm.bind_tools(all_tools)
+async def main_async():
+    """
+    Build the graph and run the REPL on one long-lived event loop.
 
-chat_node = ChatNode(llm_with_tools)
+    The MCP client and its stdio subprocess live for the whole session
+    instead of being spun up and torn down by a throwaway asyncio.run at
+    import time, which also keeps the module importable from async hosts
+    like langgraph dev.
+    """
+    mcp_client = MultiServerMCPClient(filesystem_config)
 
-mcp_node = MCPNode(mcp_client=mcp_client)
-# Build LangGraph workflow
-graph_builder = StateGraph(State)
+    # Fetch the tool list once on the session loop - subprocess spawn,
+    # MCP handshake and schema parse all happen here, off the first query
+    all_tools = await mcp_client.get_tools()
 
+    # Fire a trivial call to warm the stdio server and the OS page cache
+    # for the vault root before the user's first real query
+    warmup_tool = next(
+        (tool for tool in all_tools if tool.name == "list_directory"), None
+    )
+    if warmup_tool is not None:
+        try:
+            await warmup_tool.ainvoke({"path": vault_path})
+        except Exception as warmup_error:
+            print(f"MCP warmup call failed: {warmup_error}")
+
+    # Aggregator tool - lets the LLM collapse N file-operation turns into
+    # one tool call that fans out server-side
+    all_tools = all_tools + [make_batch_execute_tool(all_tools)]
+
+    # Initialize Ollama LLM
+    llm = ChatOllama(
+        model=os.getenv("LLM_MODEL", "gemma3:27b"),
+        base_url=os.getenv("OLLAMA_API_BASE", "http://host.docker.internal:11434"),
+        temperature=0.7,
+    )
 
-""" debug(
-    client.chat_completion(
-        messages=[{"role": "system", "content": "You are a helpful assistant."}]
+    # Bind tools to LLM
+    llm_with_tools = llm.bind_tools(all_tools)
+
+    chat_node = ChatNode(llm_with_tools)
+    mcp_node = MCPNode(mcp_client=mcp_client, tools=all_tools)
+
+    # Build LangGraph workflow
+    graph_builder = StateGraph(State)
+
+    # Add nodes to graph
+    graph_builder.add_node("chat", chat_node)
+    graph_builder.add_node("mcp", mcp_node)
+    route_tools = RouteTools("mcp", END)
+
+    graph_builder.add_edge(START, "chat")
+    graph_builder.add_conditional_edges(
+        "chat",
+        route_tools,
+        # The following dictionary lets you tell the graph to interpret the condition's outputs as a specific node
+        # It defaults to the identity function, but if you
+        # want to use a node named something else apart from "tools",
+        # You can update the value of the dictionary to something else
+        # e.g., "tools": "my_tools"
+        {"mcp": "mcp", END: END},
     )
-) """
-
-# Add nodes to graph
-graph_builder.add_node("chat", chat_node)
-graph_builder.add_node("mcp", mcp_node)
-route_tools = RouteTools("mcp", END)
-
-graph_builder.add_edge(START, "chat")
-graph_builder.add_conditional_edges(
-    "chat",
-    route_tools,
-    # The following dictionary lets you tell the graph to interpret the condition's outputs as a specific node
-    # It defaults to the identity function, but if you
-    # want to use a node named something else apart from "tools",
-    # You can update the value of the dictionary to something else
-    # e.g., "tools": "my_tools"
-    {"mcp": "mcp", END: END},
-)
-graph_builder.add_edge("mcp", "chat")
-
-
-# Compile the graph with recursion limit to prevent infinite loops
-graph = graph_builder.compile(
-    checkpointer=None,  # No checkpointing needed for now
-    interrupt_before=None,
-    interrupt_after=None,
-    debug=False
-)
-
-
-while True:
-    user_input = input("User: ")
-    if user_input.lower() in ["quit", "exit", "q"]:
-        print("Goodbye!")
-        break
-    for event in graph.stream(
-        State(
-            messages=[
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_input),
-            ]
-        ),
-        config={"recursion_limit": 15}  # Limit to 10 iterations to prevent infinite loops
-    ):
-        for value in event.values():
-            print("Assistant:", value["messages"][-1].content)
+    graph_builder.add_edge("mcp", "chat")
+
+    # Compile the graph with recursion limit to prevent infinite loops
+    graph = graph_builder.compile(
+        checkpointer=None,  # No checkpointing needed for now
+        interrupt_before=None,
+        interrupt_after=None,
+        debug=False
+    )
+
+    # Conversation persists across turns - the assistant keeps multi-turn
+    # memory and Ollama's prefix KV cache only has to prefill the new
+    # user message instead of the whole system prompt every turn
+    max_history_messages = 40
+    messages = [SYSTEM_MSG]
+
+    print(f"Ready - MCP server warm, {len(all_tools)} tools loaded.")
+
+    while True:
+        # input() blocks, so push it to a thread to keep the loop free
+        user_input = await asyncio.to_thread(input, "User: ")
+        if user_input.lower() in ["quit", "exit", "q"]:
+            print("Goodbye!")
+            break
+
+        messages.append(HumanMessage(content=user_input))
+
+        async for event in graph.astream(
+            State(messages=messages),
+            config={"recursion_limit": 15}  # Limit to 10 iterations to prevent infinite loops
+        ):
+            for value in event.values():
+                # ChatNode already streams the assistant text to stdout,
+                # so the REPL only carries the updated history forward
+                messages = value["messages"]
+
+        # Sliding window keeps context growth bounded: always retain the
+        # system prompt, then the most recent messages. The cut advances
+        # to a user-turn boundary so a ToolMessage is never separated from
+        # the AIMessage carrying its tool_calls - Ollama chat templates
+        # mishandle orphaned tool-role messages
+        if len(messages) > max_history_messages:
+            cut = len(messages) - (max_history_messages - 1)
+            while cut < len(messages) and not isinstance(messages[cut], HumanMessage):
+                cut += 1
+            if cut == len(messages):
+                # No boundary within budget - keep the whole latest turn
+                # rather than dropping it or splitting it
+                cut = next(
+                    (
+                        index
+                        for index in range(len(messages) - 1, 0, -1)
+                        if isinstance(messages[index], HumanMessage)
+                    ),
+                    1,
+                )
+            messages = [SYSTEM_MSG] + messages[cut:]
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async())
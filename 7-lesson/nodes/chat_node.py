@@ -1,24 +1,61 @@
-from typing import List
+import logging
+import sys
+from typing import List, Optional
 from langchain_core.messages import BaseMessage
 from langchain_core.language_models import BaseChatModel
 from ..graphs import State
 
+logger = logging.getLogger(__name__)
+
+
+class LazyDump:
+    """
+    Defers model_dump serialization until a log handler actually formats it.
+
+    Dumping every message is a deep copy and serialization of the whole
+    conversation (system prompt, prior tool outputs, tool calls), so it
+    must not run when debug logging is disabled.
+    """
+
+    def __init__(self, messages: List[BaseMessage]):
+        self.messages = messages
+
+    def __str__(self) -> str:
+        return str([msg.model_dump() for msg in self.messages])
+
 
 class ChatNode:
     def __init__(self, llm: BaseChatModel):
         self.llm = llm
 
-    def __call__(self, state: State) -> State:
+    async def __call__(self, state: State) -> State:
         messages: List[BaseMessage] = state["messages"]
 
-        print("----- Chat Node -----")
-        print(f"Messages to LLM: {[msg.model_dump() for msg in messages]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("----- Chat Node -----")
+            logger.debug("Messages to LLM: %s", LazyDump(messages))
 
-        # Call Ollama directly with LangChain messages
-        response: BaseMessage = self.llm.invoke(messages)
+        # Stream the response so tokens show up at first-token latency
+        # instead of after the full generation; summing the chunks also
+        # merges tool_calls emitted across them into the final message
+        response: Optional[BaseMessage] = None
+        wrote_output = False
+        async for chunk in self.llm.astream(messages):
+            if chunk.content:
+                if not wrote_output:
+                    # The node owns the display, so it also owns the
+                    # prefix - the REPL no longer echoes responses
+                    sys.stdout.write("Assistant: ")
+                    wrote_output = True
+                sys.stdout.write(chunk.content)
+                sys.stdout.flush()
+            response = chunk if response is None else response + chunk
+        if wrote_output:
+            sys.stdout.write("\n")
 
-        print(f"LLM Response: {response}")
+        logger.debug("LLM Response: %r", response)
 
         # Append to state
-        state["messages"].append(response)
+        if response is not None:
+            state["messages"].append(response)
         return state
@@ -1,40 +1,122 @@
 import asyncio
 import json
+import os
+import time
 import traceback
 from typing import Optional
-from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from ..graphs import State, get_last_message
 
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _canonical_json(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+
+except ImportError:
+    # orjson is an optional speedup - stdlib json is the baseline
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+    def _canonical_json(obj) -> str:
+        return json.dumps(obj, sort_keys=True)
+
+
+# Cap on tool-output characters appended to the conversation - everything
+# kept here is re-sent to the LLM on every subsequent turn
+MAX_TOOL_CONTENT = int(os.getenv("MAX_TOOL_CONTENT", "4000"))
+
+# Cap on entries kept from structured (list/dict) results such as large
+# directory listings - they are cut at element boundaries, not characters
+MAX_TOOL_ELEMENTS = int(os.getenv("MAX_TOOL_ELEMENTS", "100"))
+
 
 class MCPNode:
-    def __init__(self, mcp_client: Optional[MultiServerMCPClient] = None):
+    # How long the cached tool list stays valid before it is refetched
+    TOOLS_TTL_SECONDS = 60.0
+
+    # Read-only tools whose repeated identical calls can safely be served
+    # from cache; write/edit tools must always hit the server
+    CACHEABLE_TOOLS = {"read_file", "list_directory", "search_files"}
+
+    # Tools that already enforce a per-operation content budget - capping
+    # their joined output again would shrink an N-operation batch to the
+    # budget of a single call
+    SELF_TRUNCATING_TOOLS = {"batch_execute"}
+
+    def __init__(
+        self,
+        mcp_client: Optional[MultiServerMCPClient] = None,
+        tools: Optional[list] = None,
+    ):
         """
         MCP Node for LangGraph integration
 
         Args:
             mcp_client: Configured MultiServerMCPClient instance
+            tools: Optional pre-fetched tool list (e.g. the one loaded at
+                startup) so the node does not re-query the MCP server
         """
         self.mcp_client = mcp_client
 
-    def __call__(self, state: State) -> State:
+        # Tool list rarely changes, so cache the name->tool map instead of
+        # paying a full MCP list_tools round-trip on every invocation
+        self._tools_dict: Optional[dict] = (
+            {tool.name: tool for tool in tools} if tools else None
+        )
+        self._tools_fetched_at = time.monotonic() if tools else 0.0
+
+        # The injected list may contain local tools the MCP server knows
+        # nothing about (e.g. batch_execute) - keep them around so a TTL
+        # refetch cannot silently drop them
+        self._injected_tools: dict = dict(self._tools_dict or {})
+
+        # Dedup cache for identical read-only calls within one user turn -
+        # caps the cost of model loops that re-issue the same tool call
+        self._call_cache: dict = {}
+        self._cache_turn_marker: Optional[HumanMessage] = None
+
+    async def _get_tools_dict(self) -> dict:
+        """Return the cached tool map, refetching only when missing or stale."""
+        now = time.monotonic()
+        if (
+            self._tools_dict is None
+            or now - self._tools_fetched_at > self.TOOLS_TTL_SECONDS
+        ):
+            available_tools = await self.mcp_client.get_tools()
+            refreshed = {tool.name: tool for tool in available_tools}
+            # Freshly fetched server tools win; injected local tools that
+            # the server cannot return survive the refresh
+            for name, tool in self._injected_tools.items():
+                refreshed.setdefault(name, tool)
+            self._tools_dict = refreshed
+            self._tools_fetched_at = now
+        return self._tools_dict
+
+    async def __call__(self, state: State) -> State:
         """
         Execute MCP tool calls from LLM response
 
+        LangGraph supports async nodes, so the call runs directly on the
+        graph's event loop - no sync-over-async loop pumping.
+
         Args:
             state: Current graph state containing messages with potential tool calls
 
         Returns:
             Updated state with tool call results
         """
-        # Run async code in sync context
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(self._execute_async(state))
+        return await self._execute_async(state)
 
     async def _execute_async(self, state: State) -> State:
         """Internal async implementation"""
@@ -46,61 +128,169 @@ class MCPNode:
         if not last_message or not isinstance(last_message, AIMessage):
             return state
 
-        # Check if last message has tool_calls
-        tool_calls = getattr(last_message, "tool_calls", None) or []
+        # Check if last message has tool_calls - the isinstance guard above
+        # means the attribute is always present and always a list
+        tool_calls = last_message.tool_calls
         if not tool_calls:
             # No tool calls to execute
             return state
 
+        # A new user turn invalidates the per-turn dedup cache
+        last_human = next(
+            (
+                message
+                for message in reversed(state["messages"])
+                if isinstance(message, HumanMessage)
+            ),
+            None,
+        )
+        if last_human is not self._cache_turn_marker:
+            self._call_cache.clear()
+            self._cache_turn_marker = last_human
+
         try:
-            # Get available MCP tools
-            available_tools = await self.mcp_client.get_tools()
-            tools_dict = {tool.name: tool for tool in available_tools}
-
-            # Execute each tool call
-            for tool_call in tool_calls:
-                # Extract tool name, id and arguments
-                tool_call_id = tool_call.get("id", "unknown")
-                tool_name = tool_call.get("name")
-                tool_args_str = tool_call.get("args", {})
-
-                # Parse arguments if string
-                if isinstance(tool_args_str, str):
-                    tool_args = json.loads(tool_args_str)
-                else:
-                    tool_args = tool_args_str
-
-                if tool_name in tools_dict:
-                    try:
-                        # Execute the tool
-                        tool = tools_dict[tool_name]
-                        print("----- Tool Node -----")
-                        print(f"Executing tool '{tool_name}' with args: {tool_args}")
-                        tool_result = await tool.ainvoke(tool_args)
-                        print(tool_result)
+            # Get available MCP tools (cached with a TTL)
+            tools_dict = await self._get_tools_dict()
+
+            # Cap concurrency so a burst of calls does not overwhelm the
+            # stdio filesystem server
+            semaphore = asyncio.Semaphore(8)
+
+            # Bind hot lookups to locals once - LOAD_FAST in the per-call
+            # coroutines instead of repeated attribute and dict access
+            tools_dict_get = tools_dict.get
+            call_cache = self._call_cache
+            cacheable_tools = self.CACHEABLE_TOOLS
+            self_truncating_tools = self.SELF_TRUNCATING_TOOLS
+
+            async def run_one(tool_call) -> ToolMessage:
+                # Unpack once - LangChain ToolCall dicts always carry these keys
+                tool_call_id = tool_call["id"]
+                tool_name = tool_call["name"]
+                raw_args = tool_call["args"]
+
+                # LangChain adapters deliver args as a parsed dict in the
+                # common case - only fall back to JSON parsing for strings
+                tool_args = raw_args if isinstance(raw_args, dict) else _json_loads(raw_args)
+
+                tool = tools_dict_get(tool_name)
+                if tool is None:
+                    # Tool not found - report as ToolMessage with error
+                    return ToolMessage(
+                        content=f"Tool '{tool_name}' not found in available MCP tools",
+                        tool_call_id=tool_call_id,
+                        name=tool_name,
+                        status="error"
+                    )
 
-                        # Add tool result as ToolMessage (correct format for LLM)
-                        state["messages"].append(ToolMessage(
-                            content=str(tool_result),
+                # Serve repeated identical read-only calls from the per-turn
+                # cache without another stdio round-trip
+                cache_key = None
+                if tool_name in cacheable_tools:
+                    cache_key = (tool_name, _canonical_json(tool_args))
+                    cached_content = call_cache.get(cache_key)
+                    if cached_content is not None:
+                        return ToolMessage(
+                            content=cached_content,
                             tool_call_id=tool_call_id,
                             name=tool_name
-                        ))
-                    except Exception as tool_error:
-                        # Add error as ToolMessage with error status
-                        state["messages"].append(ToolMessage(
-                            content=f"Error executing tool: {str(tool_error)}",
-                            tool_call_id=tool_call_id,
-                            name=tool_name,
-                            status="error"
-                        ))
-                else:
-                    # Tool not found - add as ToolMessage with error
-                    state["messages"].append(ToolMessage(
-                        content=f"Tool '{tool_name}' not found in available MCP tools",
+                        )
+
+                try:
+                    # Execute the tool
+                    print("----- Tool Node -----")
+                    print(f"Executing tool '{tool_name}' with args: {tool_args}")
+                    async with semaphore:
+                        tool_result = await tool.ainvoke(tool_args)
+                    print(tool_result)
+
+                    # A write/edit tool may have changed the vault, so any
+                    # read result cached earlier this turn is now stale
+                    if cache_key is None:
+                        call_cache.clear()
+
+                    # Strings pass through untouched; structured results
+                    # become compact JSON, which tokenizes cheaper than a
+                    # Python repr and round-trips None/quotes correctly
+                    if isinstance(tool_result, str):
+                        content = tool_result
+                    elif isinstance(tool_result, (list, dict)):
+                        # Cut oversized structured results at element
+                        # boundaries before serializing - a character slice
+                        # of the JSON would hand the model broken syntax
+                        if (
+                            isinstance(tool_result, list)
+                            and len(tool_result) > MAX_TOOL_ELEMENTS
+                        ):
+                            dropped = len(tool_result) - MAX_TOOL_ELEMENTS
+                            tool_result = tool_result[:MAX_TOOL_ELEMENTS] + [
+                                f"…[{dropped} more entries truncated]"
+                            ]
+                        elif (
+                            isinstance(tool_result, dict)
+                            and len(tool_result) > MAX_TOOL_ELEMENTS
+                        ):
+                            dropped = len(tool_result) - MAX_TOOL_ELEMENTS
+                            tool_result = dict(
+                                list(tool_result.items())[:MAX_TOOL_ELEMENTS]
+                            )
+                            tool_result["…"] = f"[{dropped} more entries truncated]"
+                        content = _json_dumps(tool_result)
+                    else:
+                        content = str(tool_result)
+
+                    # Truncate oversized plain-text results so prefill cost
+                    # per turn stays bounded; structured results were already
+                    # capped above and must stay syntactically valid JSON
+                    if (
+                        tool_name not in self_truncating_tools
+                        and not isinstance(tool_result, (list, dict))
+                        and len(content) > MAX_TOOL_CONTENT
+                    ):
+                        overflow = len(content) - MAX_TOOL_CONTENT
+                        content = (
+                            content[:MAX_TOOL_CONTENT]
+                            + f"\n…[truncated {overflow} chars]"
+                        )
+
+                    if cache_key is not None:
+                        call_cache[cache_key] = content
+
+                    # Tool result as ToolMessage (correct format for LLM)
+                    return ToolMessage(
+                        content=content,
+                        tool_call_id=tool_call_id,
+                        name=tool_name
+                    )
+                except Exception as tool_error:
+                    # Error as ToolMessage with error status
+                    return ToolMessage(
+                        content=f"Error executing tool: {str(tool_error)}",
                         tool_call_id=tool_call_id,
                         name=tool_name,
                         status="error"
-                    ))
+                    )
+
+            # Independent tool calls run concurrently; gather returns the
+            # results in the original tool_calls order
+            results = await asyncio.gather(
+                *(run_one(tool_call) for tool_call in tool_calls),
+                return_exceptions=True,
+            )
+
+            # Collect the new messages pre-sized and extend the history once
+            # instead of growing it append-by-append per tool call
+            new_messages = [None] * len(results)
+            for index, (tool_call, result) in enumerate(zip(tool_calls, results)):
+                if isinstance(result, BaseException):
+                    result = ToolMessage(
+                        content=f"Error executing tool: {str(result)}",
+                        tool_call_id=tool_call.get("id", "unknown"),
+                        name=tool_call.get("name"),
+                        status="error"
+                    )
+                new_messages[index] = result
+            state["messages"].extend(new_messages)
 
         except Exception as e:
             # Handle MCP errors gracefully - if we can't match to a tool_call_id, log as AIMessage
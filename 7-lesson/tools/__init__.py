@@ -0,0 +1,3 @@
+from .batch_execute import make_batch_execute_tool
+
+__all__ = ["make_batch_execute_tool"]
@@ -0,0 +1,110 @@
+import asyncio
+import os
+from typing import List, Tuple
+
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
+
+# Per-operation timeout so one hung filesystem call cannot stall the batch
+OPERATION_TIMEOUT_SECONDS = 30.0
+
+# Each operation gets the same content budget an individual tool call
+# would get - same knob as the per-message cap in MCPNode
+MAX_OPERATION_CONTENT = int(os.getenv("MAX_TOOL_CONTENT", "4000"))
+
+
+class BatchOperation(BaseModel):
+    """One tool invocation inside a batch_execute call."""
+
+    tool: str = Field(description="Name of the tool to call")
+    args: dict = Field(default_factory=dict, description="Arguments for the tool")
+
+
+class BatchExecuteInput(BaseModel):
+    """Input schema for the batch_execute aggregator tool."""
+
+    operations: List[BatchOperation] = Field(
+        description="Tool calls to execute together"
+    )
+    stop_on_error: bool = Field(
+        default=False,
+        description="Run operations one at a time and stop at the first error",
+    )
+
+
+def make_batch_execute_tool(tools: list) -> StructuredTool:
+    """
+    Build an aggregator tool that runs several tool calls in one LLM turn.
+
+    Every tool turn costs a full LLM round-trip including re-prefill of the
+    growing context, so letting the model request all its file operations
+    at once collapses N tool turns into one and runs the operations
+    concurrently on this side.
+
+    Args:
+        tools: Tools that batch_execute may dispatch to
+
+    Returns:
+        StructuredTool named batch_execute
+    """
+    tools_dict = {tool.name: tool for tool in tools}
+
+    async def run_operation(operation: BatchOperation) -> Tuple[bool, str]:
+        # Success is reported out-of-band so a tool result that merely
+        # starts with "Error" is never mistaken for a failure
+        tool = tools_dict.get(operation.tool)
+        if tool is None:
+            return False, f"Error: tool '{operation.tool}' not found"
+        try:
+            result = await asyncio.wait_for(
+                tool.ainvoke(operation.args), timeout=OPERATION_TIMEOUT_SECONDS
+            )
+            text = str(result)
+            # Truncate per operation, not after joining - otherwise one
+            # large read would consume the whole batch's budget and the
+            # remaining operations would come back empty
+            if len(text) > MAX_OPERATION_CONTENT:
+                overflow = len(text) - MAX_OPERATION_CONTENT
+                text = (
+                    text[:MAX_OPERATION_CONTENT]
+                    + f"\n…[truncated {overflow} chars]"
+                )
+            return True, text
+        except Exception as error:
+            return False, f"Error: {error}"
+
+    async def batch_execute(
+        operations: List[BatchOperation], stop_on_error: bool = False
+    ) -> str:
+        if stop_on_error:
+            # Sequential so later operations can actually be skipped
+            results = []
+            for operation in operations:
+                ok, result = await run_operation(operation)
+                results.append(result)
+                if not ok:
+                    break
+        else:
+            results = [
+                result
+                for _, result in await asyncio.gather(
+                    *(run_operation(operation) for operation in operations)
+                )
+            ]
+
+        return "\n\n".join(
+            f"[{operation.tool}] {result}"
+            for operation, result in zip(operations, results)
+        )
+
+    return StructuredTool.from_function(
+        coroutine=batch_execute,
+        name="batch_execute",
+        description=(
+            "Execute multiple tool calls in one request. Use this instead of "
+            "calling tools one at a time when you need several file "
+            "operations, e.g. reading multiple files after listing a "
+            "directory."
+        ),
+        args_schema=BatchExecuteInput,
+    )